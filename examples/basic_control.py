@@ -4,14 +4,16 @@
 Basic example: Connect to controller and move motors.
 """
 
+import importlib.util
 import sys
 import os
 
-# Add src to path for development (before package install)
-root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-src = os.path.join(root, 'src')
-if src not in sys.path:
-    sys.path.insert(0, src)
+# Add src to path for development (only when the package isn't installed)
+if importlib.util.find_spec('picomotor') is None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    src = os.path.join(root, 'src')
+    if src not in sys.path:
+        sys.path.insert(0, src)
 
 from picomotor import HighLevelController
 
@@ -13,6 +13,7 @@ from .controller import (
     ControllerError,
     ConnectionError,
     TimeoutError,
+    DEVICE_ERRORS,
 )
 from .discovery import (
     discover_controllers,
@@ -31,6 +32,7 @@ __all__ = [
     "ControllerError",
     "ConnectionError",
     "TimeoutError",
+    "DEVICE_ERRORS",
     # Discovery
     "discover_controllers",
     "find_first_controller",
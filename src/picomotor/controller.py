@@ -6,15 +6,21 @@ Low-level and high-level interfaces for controlling Newport/New Focus
 8742 series 4-axis open-loop picomotor controllers via USB.
 """
 
-import re
+import array
+import functools
+import queue
+import string
+import threading
 import time
-from typing import Optional, Tuple, List
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple, List
 
 import usb.core
 import usb.util
 import cmd
 
-NEWFOCUS_COMMAND_REGEX = re.compile("([0-9]{0,1})([a-zA-Z?]{2,})([0-9+-]*)")
+from .discovery import _BACKEND
+
 MOTOR_TYPE = {
     "0": "No motor connected",
     "1": "Motor Unknown",
@@ -22,9 +28,73 @@ MOTOR_TYPE = {
     "3": "'Standard' Motor"
 }
 SYNC_COMMANDS = ['DH', 'MC', 'MV', 'PA', 'PR', 'XX']
+MOTOR_IDS = range(1, 5)
 
 # Default timeout for wait operations (seconds)
 DEFAULT_WAIT_TIMEOUT = 60.0
+# Timeout for reading a reply packet from the controller (milliseconds)
+DEFAULT_READ_TIMEOUT = 50
+# Maximum number of queued commands the I/O thread chains into one transfer
+MAX_COALESCED_COMMANDS = 8
+# Motion-done polling: start polling this long before the predicted end of a
+# move, then back off from the min to the max interval (seconds)
+WAIT_POLL_MARGIN = 0.005
+WAIT_POLL_MIN_INTERVAL = 0.002
+WAIT_POLL_MAX_INTERVAL = 0.1
+WAIT_POLL_BACKOFF = 1.5
+
+# Character classes of a NewFocus command: xxAAnn
+_DIGITS = frozenset(string.digits)
+_MNEMONIC_CHARS = frozenset(string.ascii_letters + '?')
+_PARAMETER_CHARS = frozenset(string.digits + '+-')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_newfocus_command(newfocus_command):
+    """
+    Scan a NewFocus style command into its USB form and components
+
+    Accepts an optional single-digit driver number, a mnemonic of at least two
+    letters (or '?'), and an optional signed integer parameter; anything after
+    the parameter is ignored.
+
+    Returns:
+        (usb_command, (driver_number, command, parameter)), or None if the
+            command is not of the form xxAAnn
+    """
+    end = len(newfocus_command)
+    i = 1 if end and newfocus_command[0] in _DIGITS else 0
+    j = i
+    while j < end and newfocus_command[j] in _MNEMONIC_CHARS:
+        j += 1
+    if j - i < 2:
+        return None
+    k = j
+    while k < end and newfocus_command[k] in _PARAMETER_CHARS:
+        k += 1
+
+    driver_number = newfocus_command[:i]
+    command = newfocus_command[i:j].upper()
+    parameter = newfocus_command[j:k]
+    usb_command = f'{driver_number} {command} {parameter}\r'
+    return usb_command, (driver_number, command, parameter)
+
+
+# Static queries sent on every poll, pre-encoded so they skip parsing entirely
+PRECOMPILED_COMMANDS = {
+    c: _parse_newfocus_command(c)[0].encode()
+    for c in ['VE?'] + [
+        f'{m}{op}?' for m in MOTOR_IDS
+        for op in ('MD', 'TP', 'VA', 'AC', 'PA', 'PR', 'QM', 'MV', 'DH')
+    ]
+}
+# Motion-done and position queries for all 4 channels chained into single lines
+ALL_MOTION_DONE_COMMAND = b';'.join(
+    PRECOMPILED_COMMANDS[f'{m}MD?'].rstrip(b'\r') for m in MOTOR_IDS
+) + b'\r'
+ALL_POSITIONS_COMMAND = b';'.join(
+    PRECOMPILED_COMMANDS[f'{m}TP?'].rstrip(b'\r') for m in MOTOR_IDS
+) + b'\r'
 
 
 class ControllerError(Exception):
@@ -42,10 +112,20 @@ class TimeoutError(ControllerError):
     pass
 
 
+# Errors a controller round-trip can raise: pyusb/libusb failures (USBError
+# is an IOError), malformed replies, and the controller's own errors
+DEVICE_ERRORS = (usb.core.USBError, OSError, ValueError, ControllerError)
+
+
 class Controller:
+    # (device, ep_out, ep_in) by USB (bus, address), reused when the same
+    # device is connected again
+    _EP_CACHE: Dict[Tuple[int, int], Tuple[Any, Any, Any]] = {}
+
     def __init__(self, product_id, vendor_id):
         self.product_id = product_id
         self.vendor_id = vendor_id
+        self._io_thread = None
         self._connect()
 
     def _connect(self):
@@ -53,13 +133,42 @@ class Controller:
         Connect to the controller via USB
         """
         # find the device
-        self.dev = usb.core.find(
+        dev = usb.core.find(
             idProduct=self.product_id,
-            idVendor=self.vendor_id
+            idVendor=self.vendor_id,
+            backend=_BACKEND
         )
-        if self.dev is None:
+        if dev is None:
             raise ValueError('Device not found')
 
+        if not self._use_cached_endpoints((dev.bus, dev.address)):
+            self.dev = dev
+            self._find_endpoints()
+
+        # read one max-size packet at a time into a reusable buffer, so short
+        # replies return promptly and reads don't allocate a new array
+        self._in_packet = self.ep_in.wMaxPacketSize
+        self.ep_in_timeout = DEFAULT_READ_TIMEOUT
+        self._in_buffer = array.array('B', bytes(self._in_packet))
+        self._in_view = memoryview(self._in_buffer)
+        self._start_io_thread()
+
+    def _start_io_thread(self):
+        """
+        Start the I/O thread unless it is already running
+        """
+        if self._io_thread is None or not self._io_thread.is_alive():
+            # the I/O thread owns the endpoints; callers queue commands to it
+            self._tx_q = queue.Queue()
+            self._io_thread = threading.Thread(
+                target=self._pump, name='picomotor-io', daemon=True
+            )
+            self._io_thread.start()
+
+    def _find_endpoints(self):
+        """
+        Configure self.dev and look up its endpoints
+        """
         # set the active configuration. With no arguments, the first
         # configuration will be the active one
         self.dev.set_configuration()
@@ -80,25 +189,204 @@ class Controller:
             usb.util.endpoint_direction(e.bEndpointAddress) == \
             usb.util.ENDPOINT_IN)
 
-        assert (self.ep_out and self.ep_in) is not None
+        if self.ep_out is None or self.ep_in is None:
+            raise ConnectionError('Could not find the USB endpoints')
+
+        self._EP_CACHE[(self.dev.bus, self.dev.address)] = (
+            self.dev, self.ep_out, self.ep_in
+        )
+
+    def _use_cached_endpoints(self, key):
+        """
+        Reuse the device and endpoints cached for a USB (bus, address)
+
+        Returns:
+            True if the cached device could be configured again
+        """
+        cached = self._EP_CACHE.get(key)
+        if cached is None:
+            return False
+        try:
+            cached[0].set_configuration()
+        except usb.core.USBError:
+            # stale entry, e.g. the device was unplugged
+            del self._EP_CACHE[key]
+            return False
+        self.dev, self.ep_out, self.ep_in = cached
+        return True
+
+    def reconnect(self):
+        """
+        Re-establish the USB connection, reusing the cached endpoints when the
+        device is still at the same address; also reopens a closed controller
+        """
+        usb.util.dispose_resources(self.dev)
+        if self._use_cached_endpoints((self.dev.bus, self.dev.address)):
+            self._start_io_thread()
+        else:
+            self._connect()
 
+    def close(self):
+        """
+        Stop the I/O thread and release the USB device
+        """
+        if self._io_thread is not None:
+            self._tx_q.put(None)
+            self._io_thread.join()
+            self._io_thread = None
+            # fail commands queued behind the stop request
+            while True:
+                try:
+                    item = self._tx_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[1].set_exception(ConnectionError('Controller is closed'))
+        usb.util.dispose_resources(self.dev)
+
+    def submit(self, usb_command):
+        """Queue command for the I/O thread without waiting for it to be sent
+
+        Commands queued back-to-back are chained into a single transfer.
 
+        Args:
+            usb_command (str, bytes or iterable of str): Correctly formated
+                command for USB driver, or several of them to be chained with
+                ';' and sent in a single transfer
+
+        Returns:
+            concurrent.futures.Future resolving to the raw bytes of the
+                controller's reply, or None if no reply is requested
+
+        Raises:
+            ConnectionError: If the controller has been closed
+        """
+        if self._io_thread is None or not self._io_thread.is_alive():
+            raise ConnectionError('Controller is closed')
+        if isinstance(usb_command, str):
+            usb_command = usb_command.encode()
+        elif not isinstance(usb_command, bytes):
+            usb_command = (';'.join(c.rstrip('\r') for c in usb_command) + '\r').encode()
+        future = Future()
+        self._tx_q.put((usb_command, future))
+        return future
 
     def send_command(self, usb_command):
         """Send command to USB device endpoint
 
         Args:
-            usb_command (str): Correctly formated command for USB driver
-            get_reply (bool): query the IN endpoint after sending command, to
-                get controller's reply
+            usb_command (str, bytes or iterable of str): Correctly formated
+                command for USB driver, or several of them to be chained with
+                ';' and sent in a single transfer
 
         Returns:
-            Character representation of returned hex values if a reply is
-                requested
+            Raw bytes of the controller's reply if a reply is requested
         """
+        return self.submit(usb_command).result()
+
+    def _pump(self):
+        """I/O thread: drain the queue, chaining up to MAX_COALESCED_COMMANDS
+        queued commands into each transfer and resolving their futures"""
+        running = True
+        while running:
+            item = self._tx_q.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < MAX_COALESCED_COMMANDS:
+                try:
+                    item = self._tx_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            # skip commands cancelled while queued; the rest can't be cancelled now
+            batch = [(c, f) for c, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                self._transfer(batch)
+            except Exception as e:
+                # nothing may escape: callers would block on their futures forever
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._drain_input()
+
+    def _transfer(self, batch):
+        """Send a batch of queued commands as one transfer and resolve their
+        futures with the replies to their own queries"""
+        if len(batch) == 1:
+            usb_command = batch[0][0]
+        else:
+            usb_command = b';'.join(c.rstrip(b'\r') for c, _ in batch) + b'\r'
         self.ep_out.write(usb_command)
-        if '?' in usb_command:
-            return self.ep_in.read(100)
+
+        # commands without queries are done once written, so a failed read
+        # only fails the callers that are waiting for a reply
+        queries = []
+        for c, future in batch:
+            n = c.count(b'?')
+            if n:
+                queries.append((n, future))
+            else:
+                future.set_result(None)
+        if not queries:
+            return
+
+        reply = self._read_reply(sum(n for n, _ in queries))
+        if len(queries) == 1:
+            queries[0][1].set_result(reply)
+            return
+        # hand each command the replies to its own queries
+        lines = reply.split(b'\r\n')
+        i = 0
+        for n, future in queries:
+            future.set_result(b'\r\n'.join(lines[i:i + n]) + b'\r\n')
+            i += n
+
+    def _read_reply(self, expected=1):
+        """Read from the IN endpoint until `expected` replies have arrived
+
+        Each reply is terminated by CR/LF, so chained queries may span several
+        reads.
+        """
+        n = self.ep_in.read(self._in_buffer, self.ep_in_timeout)
+        reply = bytes(self._in_view[:n])
+        while expected > 1 and reply.count(b'\r\n') < expected:
+            n = self.ep_in.read(self._in_buffer, self.ep_in_timeout)
+            reply += self._in_view[:n]
+        return reply
+
+    def _drain_input(self):
+        """Discard pending IN data, e.g. a reply that arrived after its read
+        timed out, so it is not taken as the reply to the next query"""
+        while True:
+            try:
+                self.ep_in.read(self._in_buffer, self.ep_in_timeout)
+            except Exception:
+                # a timeout, or the device is gone: nothing left to read
+                return
+
+    def send_batch(self, commands):
+        """Send several NewFocus formated commands in a single USB transfer
+
+        Args:
+            commands (iterable of str): Legal commands listed in usermanual [2 - 6.2]
+
+        Returns:
+            replies (list of str): Human readable replies, one per query in
+                `commands`, in the order they were given
+        """
+        usb_commands = [self.parse_command(c)[0] for c in commands]
+        reply = self.send_command(usb_commands)
+
+        if reply:
+            return [r.strip() for r in self.parse_reply(reply).split('\r\n')]
+        return []
 
     def parse_command(self, newfocus_command):
         """
@@ -111,28 +399,23 @@ class Controller:
                 it could also have optional or required preceding (xx) and/or
                 following (nn) parameters.
         """
-        match = NEWFOCUS_COMMAND_REGEX.match(newfocus_command)
-
-        # Check to see if a regex match was found in the user submitted command
-        if match:
-            # Extract matched components of the command
-            driver_number, command, parameter = match.groups()
-            usb_command = f'{driver_number or ""} {command} {parameter or ""}\r'
+        parsed = _parse_newfocus_command(newfocus_command)
 
-            return usb_command.upper(), (driver_number, command.upper(), parameter)
+        # Check to see if the user submitted command could be scanned
+        if parsed:
+            return parsed
         else:
             print(f'ERROR! Command {newfocus_command} was not a valid format')
 
     def parse_reply(self, reply):
         """
         Args:
-            reply (list): list of bytes returns from controller in hex format
+            reply (bytes): bytes returned from controller
 
         Returns:
             reply (str): Cleaned string of controller reply
         """
-        reply = ''.join([chr(x) for x in reply])
-        return reply.rstrip()
+        return bytes(reply).decode('ascii', 'ignore').rstrip()
 
     def command(self, command):
         """Send NewFocus formated command
@@ -143,7 +426,9 @@ class Controller:
         Returns:
             reply (str): Human readable reply from controller
         """
-        usb_command, _ = self.parse_command(command)
+        usb_command = PRECOMPILED_COMMANDS.get(command)
+        if usb_command is None:
+            usb_command, _ = self.parse_command(command)
 
         reply = self.send_command(usb_command)
 
@@ -160,47 +445,96 @@ class HighLevelController(Controller):
         velocity: Default velocity for all motors (steps/sec)
         acceleration: Default acceleration for all motors (steps/sec²)
         wait_timeout: Timeout for motion completion (seconds)
+        verify: Query and print controller details and motor types on connect
     """
     
     def __init__(self, product_id: int, vendor_id: int, velocity: int = 1000, 
-                 acceleration: int = 1000, wait_timeout: float = DEFAULT_WAIT_TIMEOUT):
+                 acceleration: int = 1000, wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+                 verify: bool = True):
         super().__init__(product_id=product_id, vendor_id=vendor_id)
         self.wait_timeout = wait_timeout
-        self.confirm_connection()
-        # Initialize velocity/acceleration for all 4 motor channels
-        for motor_idx in range(1, 5):
-            self.set_velocity(motor_idx, velocity)
-            self.set_acceleration(motor_idx, acceleration)
+        # Last velocity/acceleration written to each motor channel
+        self._velocity: Dict[int, int] = {}
+        self._acceleration: Dict[int, int] = {}
+        if verify:
+            self.confirm_connection()
+        # Initialize velocity/acceleration for all 4 motor channels in one transfer
+        self.send_batch(
+            [f'{m}VA{velocity}' for m in MOTOR_IDS] +
+            [f'{m}AC{acceleration}' for m in MOTOR_IDS]
+        )
 
     def confirm_connection(self):
-        # Confirm connection to user
-        res = self.get_controller_details()
+        # Confirm connection to user, querying details and motor types at once
+        res, *motor_types = self.send_batch(['VE?'] + [f'{m}QM?' for m in MOTOR_IDS])
+        details = res.split(' ')
+        if (len(details) < 4 or len(motor_types) != len(MOTOR_IDS)
+                or not all(n in MOTOR_TYPE for n in motor_types)):
+            raise ControllerError(f"Unexpected reply to connection check: {[res, *motor_types]!r}")
         print("Connected to Motor Controller Model {}. Firmware {} {} {}\n".format(
-            *res.split(' ')
+            *details
         ))
-        for m in range(1, 5):
-            res = self.get_motor_type(m)
-            print(f"Motor #{m}: {res}")
+        for m, n in zip(MOTOR_IDS, motor_types):
+            print(f"Motor #{m}: {MOTOR_TYPE[n]}")
 
     def command(self, command):
         """
         Make the command function synchronous by waiting for the motors to stop
         """
-        usb_command, commannd_tuple = self.parse_command(command)
+        usb_command = PRECOMPILED_COMMANDS.get(command)
+        if usb_command is not None:
+            # static queries never need to wait for motion or touch the caches
+            reply = self.send_command(usb_command)
+        else:
+            usb_command, commannd_tuple = self.parse_command(command)
 
-        motor_id, command, parameter = commannd_tuple
-        if command in SYNC_COMMANDS:
-            self.wait()
-        reply = self.send_command(usb_command)
+            motor_id, command, parameter = commannd_tuple
+            if command in SYNC_COMMANDS:
+                self.wait()
+            reply = self.send_command(usb_command)
+            self._track_setting(motor_id, command, parameter)
 
         if reply:
             return self.parse_reply(reply)
 
-    def wait(self, timeout: Optional[float] = None) -> bool:
+    def send_batch(self, commands):
+        """
+        Make send_batch synchronous too, waiting for the motors to stop if any
+        of the chained commands is a motion command
+        """
+        commands = list(commands)
+        parsed = [self.parse_command(c)[1] for c in commands]
+        if any(command in SYNC_COMMANDS for _, command, _ in parsed):
+            self.wait()
+        replies = super().send_batch(commands)
+        for command_tuple in parsed:
+            self._track_setting(*command_tuple)
+        return replies
+
+    def _track_setting(self, motor_id, command, parameter):
+        """Keep the cached velocity/acceleration in step with commands sent"""
+        if command == 'VA':
+            cache = self._velocity
+        elif command == 'AC':
+            cache = self._acceleration
+        else:
+            return
+        if motor_id and parameter:
+            cache[int(motor_id)] = int(parameter)
+        else:
+            cache.clear()
+
+    def wait(self, timeout: Optional[float] = None, expected_duration: float = 0.0) -> bool:
         """Wait for all motors to stop moving.
         
+        Polling starts shortly before `expected_duration` has elapsed and backs
+        off exponentially, so short moves return quickly while long moves don't
+        flood the bus with queries.
+        
         Args:
-            timeout: Maximum time to wait (seconds). Uses self.wait_timeout if None.
+            timeout: Maximum time to wait (seconds) once `expected_duration` has
+                elapsed. Uses self.wait_timeout if None.
+            expected_duration: Predicted time until motion completes (seconds).
             
         Returns:
             True if all motors stopped, False if timeout occurred.
@@ -209,19 +543,26 @@ class HighLevelController(Controller):
             TimeoutError: If timeout is reached and motors still moving.
         """
         timeout = timeout if timeout is not None else self.wait_timeout
+        time.sleep(max(0.0, expected_duration - WAIT_POLL_MARGIN))
+        # the timeout covers overrunning the prediction, not the move itself
         start_time = time.time()
+        delay = WAIT_POLL_MIN_INTERVAL
         
         while True:
-            # Check all 4 motor channels
-            all_done = all(self.get_motion_done(m) for m in range(1, 5))
-            if all_done:
+            if self._all_motion_done():
                 return True
                 
             # Check timeout
             if time.time() - start_time > timeout:
                 raise TimeoutError(f"Motion did not complete within {timeout}s")
                 
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(WAIT_POLL_MAX_INTERVAL, delay * WAIT_POLL_BACKOFF)
+
+    def _all_motion_done(self) -> bool:
+        """Check all 4 motor channels with one pre-encoded chained MD? query"""
+        reply = self.parse_reply(self.send_command(ALL_MOTION_DONE_COMMAND))
+        return all(r.strip() == '1' for r in reply.split('\r\n'))
 
     def get_controller_details(self):
         return self.command('VE?')
@@ -230,7 +571,9 @@ class HighLevelController(Controller):
         self.command(f'{motor_id}AC{acceleration}')
 
     def get_acceleration(self, motor_id):
-        return int(self.command(f'{motor_id}AC?'))
+        if motor_id not in self._acceleration:
+            self._acceleration[motor_id] = int(self.command(f'{motor_id}AC?'))
+        return self._acceleration[motor_id]
 
     def set_home_position(self, motor_id):
         self.command(f'{motor_id}DH')
@@ -249,8 +592,7 @@ class HighLevelController(Controller):
             direction: '+' for positive, '-' for negative
         """
         self.command(f'{motor_id}MV{direction}')
-        time.sleep(0.5)
-        self.wait()
+        self.wait(expected_duration=0.5)
 
     def get_motion_direction(self, motor_id):
         return int(self.command(f'{motor_id}MV?'))
@@ -260,13 +602,10 @@ class HighLevelController(Controller):
         Move to target position and wait for the motor to stop moving
         """
         target = int(target)
-        self.command(f'{motor_id}PA{target}')
-
-        position = self.get_position(motor_id)
-        num_of_steps = abs(target - position)
-        delay = num_of_steps / self.get_velocity(motor_id)
-        time.sleep(delay)
-        self.wait()
+        # Read the start position in the same transfer that starts the move
+        position, = self.send_batch([f'{motor_id}TP?', f'{motor_id}PA{target}'])
+        num_of_steps = abs(target - int(position))
+        self.wait(expected_duration=num_of_steps / self.get_velocity(motor_id))
 
     def get_target(self, motor_id):
         return int(self.command(f'{motor_id}PA?'))
@@ -277,30 +616,79 @@ class HighLevelController(Controller):
         """
         steps = int(steps)
         self.command(f'{motor_id}PR{steps}')
-        delay = abs(steps) / self.get_velocity(motor_id)
-        time.sleep(delay)
-        self.wait()
+        self.wait(expected_duration=abs(steps) / self.get_velocity(motor_id))
+
+    def move_all_relative(self, steps: Dict[int, int]) -> None:
+        """Move several motors relative to their positions at the same time.
+        
+        All PR commands go out in one USB transfer, so the motors start
+        together, and a single wait covers the whole move.
+        
+        Args:
+            steps: Dict mapping motor channel (1-4) to steps to move
+        """
+        steps = {motor_id: int(s) for motor_id, s in steps.items()}
+        if not steps:
+            return
+        self.send_batch([f'{motor_id}PR{s}' for motor_id, s in steps.items()])
+        self.wait(expected_duration=max(
+            abs(s) / self.get_velocity(motor_id) for motor_id, s in steps.items()
+        ))
 
     def get_target_relative(self, motor_id):
         return int(self.command(f'{motor_id}PR?'))
 
     def get_motor_type(self, motor_id):
         n = self.command(f'{motor_id}QM?')
+        if n not in MOTOR_TYPE:
+            raise ControllerError(f"Unexpected motor type reply: {n!r}")
         return MOTOR_TYPE[n]
 
+    def get_motor_types(self) -> Dict[int, str]:
+        """Get the motor type of all 4 channels with a single chained query.
+        
+        Returns:
+            Dict mapping motor channel (1-4) to its motor type description
+            
+        Raises:
+            ControllerError: If the reply is not one known motor type per channel.
+        """
+        replies = self.send_batch([f'{m}QM?' for m in MOTOR_IDS])
+        if len(replies) != len(MOTOR_IDS) or not all(n in MOTOR_TYPE for n in replies):
+            raise ControllerError(f"Unexpected motor type reply: {replies!r}")
+        return {m: MOTOR_TYPE[n] for m, n in zip(MOTOR_IDS, replies)}
+
     def stop_motion(self, motor_id=None):
-        if motor_id:
-            self.command(f'{motor_id}ST')
-        self.command(f'ST')
+        self.command(f'{motor_id}ST' if motor_id else 'ST')
 
     def get_position(self, motor_id):
         return int(self.command(f'{motor_id}TP?'))
 
+    def get_all_positions(self) -> Dict[int, int]:
+        """Get current position of all 4 motors with a single chained query.
+        
+        Returns:
+            Dict mapping motor channel (1-4) to its position in steps
+            
+        Raises:
+            ControllerError: If the reply is not one integer per channel.
+        """
+        reply = self.parse_reply(self.send_command(ALL_POSITIONS_COMMAND))
+        values = reply.split('\r\n')
+        if len(values) == len(MOTOR_IDS):
+            try:
+                return {m: int(r) for m, r in zip(MOTOR_IDS, values)}
+            except ValueError:
+                pass
+        raise ControllerError(f"Unexpected position reply: {reply!r}")
+
     def set_velocity(self, motor_id, velocity):
         self.command(f'{motor_id}VA{velocity}')
 
     def get_velocity(self, motor_id):
-        return int(self.command(f'{motor_id}VA?'))
+        if motor_id not in self._velocity:
+            self._velocity[motor_id] = int(self.command(f'{motor_id}VA?'))
+        return self._velocity[motor_id]
 
 
 class ControllerConsole(cmd.Cmd):
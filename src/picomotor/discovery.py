@@ -5,10 +5,19 @@ Newport 8742 Picomotor Controller Discovery
 Auto-detect connected Newport/New Focus 8742 controllers via USB.
 """
 
-from typing import List, Dict, Optional, Any
+import time
+from typing import List, Dict, Optional, Any, Tuple, cast
 import usb.core
 import usb.util
 
+# Look up the libusb1 backend once and hand it to every usb.core.find, instead
+# of letting pyusb probe for a backend on each call (None: pyusb's default search)
+try:
+    import usb.backend.libusb1
+    _BACKEND = usb.backend.libusb1.get_backend()
+except ImportError:
+    _BACKEND = None
+
 # Newport/New Focus USB identifiers
 # The 8742 controller uses these IDs (verify with your device)
 NEWPORT_VENDOR_ID = 0x104D  # Newport Corporation
@@ -16,6 +25,38 @@ KNOWN_PRODUCT_IDS = [
     0x4000,  # 8742 Open-loop controller (common)
 ]
 
+# String descriptors by (bus, address, vid, pid), so repeated scans skip the
+# control transfers; entries are refreshed after _STR_CACHE_TTL seconds
+_STR_CACHE_TTL = 5.0
+_STR_CACHE: Dict[Tuple[int, int, int, int], Tuple[float, Dict[str, Optional[str]]]] = {}
+
+
+def _safe_get_string(dev, index: int) -> Optional[str]:
+    """Read a string descriptor, or None if absent or unreadable (e.g. without permissions)."""
+    if not index:
+        return None
+    try:
+        return cast(Optional[str], usb.util.get_string(dev, index))
+    except (usb.core.USBError, ValueError):
+        return None
+
+
+def _get_strings(dev) -> Dict[str, Optional[str]]:
+    """Get serial/manufacturer/product strings, from cache if recently read."""
+    key = (dev.bus, dev.address, dev.idVendor, dev.idProduct)
+    now = time.monotonic()
+    cached = _STR_CACHE.get(key)
+    if cached is not None and now - cached[0] < _STR_CACHE_TTL:
+        return cached[1]
+    
+    strings = {
+        "serial": _safe_get_string(dev, dev.iSerialNumber),
+        "manufacturer": _safe_get_string(dev, dev.iManufacturer),
+        "product": _safe_get_string(dev, dev.iProduct),
+    }
+    _STR_CACHE[key] = (now, strings)
+    return strings
+
 
 def discover_controllers(
     vendor_id: Optional[int] = None,
@@ -44,51 +85,29 @@ def discover_controllers(
         ]
     """
     vid = vendor_id or NEWPORT_VENDOR_ID
-    pids = [product_id] if product_id else KNOWN_PRODUCT_IDS
+    pids = {product_id} if product_id else set(KNOWN_PRODUCT_IDS)
     
     devices = []
     
-    for pid in pids:
-        try:
-            found = usb.core.find(find_all=True, idVendor=vid, idProduct=pid)
-            for dev in found:
-                info = {
-                    "vendor_id": dev.idVendor,
-                    "product_id": dev.idProduct,
-                    "bus": dev.bus,
-                    "address": dev.address,
-                    "serial": None,
-                    "manufacturer": None,
-                    "product": None,
-                }
-                
-                # Try to get string descriptors (may fail without permissions)
-                try:
-                    if dev.iSerialNumber:
-                        info["serial"] = usb.util.get_string(dev, dev.iSerialNumber)
-                except (usb.core.USBError, ValueError):
-                    pass
-                    
-                try:
-                    if dev.iManufacturer:
-                        info["manufacturer"] = usb.util.get_string(dev, dev.iManufacturer)
-                except (usb.core.USBError, ValueError):
-                    pass
-                    
-                try:
-                    if dev.iProduct:
-                        info["product"] = usb.util.get_string(dev, dev.iProduct)
-                except (usb.core.USBError, ValueError):
-                    pass
-                
-                devices.append(info)
-                
-        except usb.core.NoBackendError:
-            print("[Discovery] No USB backend found. Install libusb.")
-            break
-        except usb.core.USBError as e:
-            print(f"[Discovery] USB error scanning for PID {pid:#06x}: {e}")
-            continue
+    # Walk the device tree once for the vendor and filter product IDs here
+    try:
+        for dev in usb.core.find(find_all=True, idVendor=vid, backend=_BACKEND):
+            if dev.idProduct not in pids:
+                continue
+            info = {
+                "vendor_id": dev.idVendor,
+                "product_id": dev.idProduct,
+                "bus": dev.bus,
+                "address": dev.address,
+            }
+            info.update(_get_strings(dev))
+            
+            devices.append(info)
+            
+    except usb.core.NoBackendError:
+        print("[Discovery] No USB backend found. Install libusb.")
+    except usb.core.USBError as e:
+        print(f"[Discovery] USB error scanning for VID {vid:#06x}: {e}")
     
     return devices
 
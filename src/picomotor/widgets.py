@@ -0,0 +1,638 @@
+# SPDX-License-Identifier: MIT
+"""
+Newport 8742 Picomotor Controller GUI Widgets
+
+PyQt5 window and background position poller used by the standalone GUI
+(see picomotor.gui). Kept separate so the command-line paths of the GUI
+entry point never have to import Qt.
+"""
+
+import functools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QPushButton,
+    QLineEdit, QGridLayout, QHBoxLayout
+)
+from PyQt5.QtCore import QEvent, QLocale, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QIntValidator
+
+from .controller import HighLevelController, MOTOR_TYPE, DEVICE_ERRORS
+
+CHANNELS = (1, 2, 3, 4)
+# Range accepted by the step and target inputs
+STEP_LIMIT = 10_000_000
+
+_STYLE_RED = "color: red;"
+_STYLE_GREEN = "color: green;"
+_STATUS_NOT_CONNECTED = "Not connected"
+
+
+class PositionPoller(QThread):
+    """
+    Background thread polling motor positions, so USB round-trips never
+    block the GUI thread.
+    
+    Emits positions_ready with {channel: position, or None if no motor} and
+    errors with {channel: message} for channels that could not be read.
+    """
+    
+    positions_ready = pyqtSignal(dict)
+    errors = pyqtSignal(dict)
+    
+    # Motor types that can be driven ('Tiny' and 'Standard' motors)
+    _MOTOR_OK = frozenset({MOTOR_TYPE["2"], MOTOR_TYPE["3"]})
+    
+    def __init__(
+        self,
+        controller: HighLevelController,
+        lock: threading.Lock,
+        interval_ms: int = 500,
+        parent=None
+    ):
+        super().__init__(parent)
+        self.controller = controller
+        self.lock = lock
+        self.interval_ms = interval_ms
+        self._paused = False
+        self._wake = threading.Event()
+        # Motor types hardly change, so read them once and only re-verify
+        # after a failed poll; _motor_ok holds the result of checking them
+        self._motor_type_cache: Dict[int, str] = {}
+        self._motor_ok: Dict[int, bool] = {}
+        # Last failure and its per-channel messages, reused while the same
+        # error repeats (e.g. every poll during a disconnect)
+        self._last_error: Optional[Tuple[type, tuple]] = None
+        self._last_errors: Dict[int, str] = {}
+
+    def poll(self) -> Tuple[Dict[int, Optional[int]], Dict[int, str]]:
+        """Read all channels once, returning (positions, errors)."""
+        with self.lock:
+            try:
+                if not self._motor_type_cache:
+                    self._motor_type_cache = self.controller.get_motor_types()
+                    self._motor_ok = {
+                        channel: motor_type in self._MOTOR_OK
+                        for channel, motor_type in self._motor_type_cache.items()
+                    }
+                all_positions = self.controller.get_all_positions()
+                positions = {
+                    channel: all_positions[channel] if ok else None
+                    for channel, ok in self._motor_ok.items()
+                }
+            except DEVICE_ERRORS as e:
+                self._motor_type_cache = {}
+                error = (type(e), e.args)
+                if error != self._last_error:
+                    self._last_error = error
+                    self._last_errors = {channel: str(e) for channel in CHANNELS}
+                return {}, self._last_errors
+        
+        self._last_error = None
+        return positions, {}
+
+    def _unexpected_error(self, error: Exception) -> Dict[int, str]:
+        """Report an error poll() did not handle, once per distinct error."""
+        self._motor_type_cache = {}
+        message = f"Unexpected polling error: {error!r}"
+        if self._last_errors.get(CHANNELS[0]) != message:
+            print(message)
+            self._last_error = None
+            self._last_errors = {channel: message for channel in CHANNELS}
+        return self._last_errors
+
+    def poll_channel(self, channel: int) -> Tuple[Dict[int, Optional[int]], Dict[int, str]]:
+        """Read a single channel, returning (positions, errors) like poll().
+        
+        Falls back to a full poll() while motor types are not known yet.
+        """
+        if channel not in self._motor_ok:
+            return self.poll()
+        if not self._motor_ok[channel]:
+            return {channel: None}, {}
+        with self.lock:
+            try:
+                return {channel: self.controller.get_position(channel)}, {}
+            except DEVICE_ERRORS as e:
+                self._motor_type_cache = {}
+                return {}, {channel: str(e)}
+
+    def set_interval(self, interval_ms: int):
+        """Change the polling interval, taking effect immediately."""
+        if interval_ms != self.interval_ms:
+            self.interval_ms = interval_ms
+            self._wake.set()
+
+    def pause(self):
+        """Stop polling until resume() is called."""
+        self._paused = True
+
+    def resume(self):
+        """Restart polling after pause()."""
+        if self._paused:
+            self._paused = False
+            self._wake.set()
+
+    def poll_now(self):
+        """Run the next poll immediately instead of after the interval."""
+        self._wake.set()
+
+    def stop(self):
+        """Ask the thread to finish and wake it if it is sleeping."""
+        self.requestInterruption()
+        self._wake.set()
+
+    def run(self):
+        """Poll until interruption is requested."""
+        while not self.isInterruptionRequested():
+            if self._paused:
+                self._wake.wait()
+            else:
+                try:
+                    positions, errors = self.poll()
+                except Exception as e:
+                    # last resort: an exception escaping run() aborts the GUI
+                    positions, errors = {}, self._unexpected_error(e)
+                self.positions_ready.emit(positions)
+                if errors:
+                    self.errors.emit(errors)
+                self._wake.wait(self.interval_ms / 1000)
+            self._wake.clear()
+
+
+class PicomotorGUI(QWidget):
+    """
+    Standalone GUI for Newport 8742 Picomotor Controller.
+    
+    Connects directly to USB — no server required.
+    """
+    
+    # Unchanged polls before dropping to the idle polling interval
+    IDLE_TICKS = 10
+    # Jog clicks arriving within this window are merged into one move (ms)
+    JOG_COALESCE_MS = 20
+    # Holding a jog button repeats it after this delay, at this interval (ms)
+    JOG_REPEAT_DELAY_MS = 300
+    JOG_REPEAT_INTERVAL_MS = 50
+    
+    # Emitted from the motion thread: (status text, channels moved) once a
+    # move completes, or the status text when it fails
+    _move_finished = pyqtSignal(str, tuple)
+    _move_failed = pyqtSignal(str)
+    
+    def __init__(
+        self,
+        controller: Optional[HighLevelController] = None,
+        config: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__()
+        self.controller = controller
+        self.config = config or {}
+        
+        self.setWindowTitle("Newport 8742 Picomotor Control")
+        self.positions = {}
+        self.step_inputs = {}
+        self.abs_inputs = {}
+        self.pos_labels = {}
+        self.buttons = {}
+        self.channel_labels = {}  # channel_id -> label string
+        self._label_text: Dict[int, str] = {}  # channel_id -> text currently shown
+        self._enabled_state: Dict[int, bool] = {}  # channel_id -> controls enabled
+        self._step_cache: Dict[int, int] = {}  # channel_id -> parsed jog step size
+        
+        self._load_channel_labels()
+        self._build_ui()
+        
+        # Relative steps requested by jog clicks but not sent yet
+        self._pending_rel: Dict[int, int] = defaultdict(int)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_relative)
+        
+        # Moves block until the motors stop, so they run one at a time on a
+        # motion thread; jogs requested meanwhile are merged into the next one
+        self._motion = ThreadPoolExecutor(max_workers=1)
+        self._moves_in_flight = 0
+        self._closed = False
+        self._move_finished.connect(self._on_move_finished)
+        self._move_failed.connect(self._on_move_failed)
+        
+        # Poll quickly while motors move and back off once positions settle
+        self._active_interval = self.config.get("poll_interval_ms", 100)
+        self._idle_interval = self.config.get("idle_poll_interval_ms", 2000)
+        self._idle_ticks = 0
+        self._last_positions: Optional[Dict[int, Optional[int]]] = None
+        # "speed" leaves the post-move readback to the poller; "accuracy"
+        # reads positions back synchronously after every move
+        self._sync_readback = self.config.get("readback_mode", "speed") == "accuracy"
+        
+        # Start position polling in the background; the lock serializes the
+        # poller with the GUI's synchronous readbacks. Moves don't take it, so
+        # positions keep updating while motors move (the controller's I/O
+        # thread already serializes the USB transfers themselves)
+        self._io_lock = threading.Lock()
+        self.poller = None
+        if self.controller is not None:
+            self.poller = PositionPoller(
+                self.controller, self._io_lock, self._active_interval
+            )
+            self.poller.positions_ready.connect(self._apply_positions)
+            self.poller.errors.connect(self._apply_errors)
+            self.poller.start()
+
+    def _load_channel_labels(self):
+        """Load channel labels from config or use defaults."""
+        channels_cfg = self.config.get("channels", {})
+        
+        for ch in CHANNELS:
+            ch_str = str(ch)
+            if ch_str in channels_cfg:
+                # Config can be string or dict
+                cfg = channels_cfg[ch_str]
+                if isinstance(cfg, str):
+                    self.channel_labels[ch] = cfg
+                elif isinstance(cfg, dict):
+                    label = cfg.get("label") or cfg.get("role") or f"Motor {ch}"
+                    self.channel_labels[ch] = label
+                else:
+                    self.channel_labels[ch] = f"Motor {ch}"
+            else:
+                self.channel_labels[ch] = f"Motor {ch}"
+
+    def _build_ui(self):
+        """Build the GUI layout."""
+        main_layout = QVBoxLayout()
+        
+        # Header with connection status
+        header = QHBoxLayout()
+        header.addWidget(QLabel("Newport 8742 Picomotor Controller"))
+        self.conn_label = QLabel("Disconnected" if not self.controller else "Connected")
+        self.conn_label.setStyleSheet(
+            _STYLE_RED if not self.controller else _STYLE_GREEN
+        )
+        header.addStretch()
+        header.addWidget(self.conn_label)
+        main_layout.addLayout(header)
+        
+        # One grid row per motor channel (1-4), with a shared header row
+        validator = QIntValidator(-STEP_LIMIT, STEP_LIMIT, self)
+        # plain digits only, so accepted text always parses with int()
+        locale = QLocale(QLocale.C)
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        validator.setLocale(locale)
+        grid = QGridLayout()
+        for col, title in enumerate(("Motor", "Position", "Step", "", "", "Target")):
+            grid.addWidget(QLabel(title), 0, col)
+        
+        for channel in CHANNELS:
+            label = self.channel_labels.get(channel, f"Motor {channel}")
+            grid.addWidget(QLabel(f"{label} (Ch {channel})"), channel, 0)
+            
+            self.pos_labels[channel] = QLabel("---")
+            grid.addWidget(self.pos_labels[channel], channel, 1)
+
+            # Jog controls
+            self.step_inputs[channel] = QLineEdit("100")
+            self.step_inputs[channel].setFixedWidth(60)
+            self.step_inputs[channel].setValidator(validator)
+            self.step_inputs[channel].setProperty("channel", channel)
+            self.step_inputs[channel].editingFinished.connect(self._on_step_edited)
+            self._step_cache[channel] = 100
+            grid.addWidget(self.step_inputs[channel], channel, 2)
+            
+            btn_neg = QPushButton("◀ -")
+            btn_pos = QPushButton("+ ▶")
+            for btn, direction in ((btn_neg, -1), (btn_pos, 1)):
+                # repeats only add to the pending jog, which is sent as one move
+                btn.setFixedWidth(50)
+                btn.setAutoRepeat(True)
+                btn.setAutoRepeatDelay(self.JOG_REPEAT_DELAY_MS)
+                btn.setAutoRepeatInterval(self.JOG_REPEAT_INTERVAL_MS)
+                btn.setProperty("channel", channel)
+                btn.setProperty("direction", direction)
+                btn.pressed.connect(self._on_jog_pressed)
+            grid.addWidget(btn_neg, channel, 3)
+            grid.addWidget(btn_pos, channel, 4)
+
+            # Absolute controls
+            self.abs_inputs[channel] = QLineEdit("0")
+            self.abs_inputs[channel].setFixedWidth(60)
+            self.abs_inputs[channel].setValidator(validator)
+            grid.addWidget(self.abs_inputs[channel], channel, 5)
+            
+            btn_go = QPushButton("Go")
+            btn_go.setFixedWidth(40)
+            btn_go.setProperty("channel", channel)
+            btn_go.clicked.connect(self._on_go_clicked)
+            grid.addWidget(btn_go, channel, 6)
+            
+            btn_home = QPushButton("Set Zero")
+            btn_home.setProperty("channel", channel)
+            btn_home.clicked.connect(self._on_home_clicked)
+            grid.addWidget(btn_home, channel, 7)
+
+            self.buttons[channel] = [btn_neg, btn_pos, btn_go, btn_home,
+                                     self.step_inputs[channel], self.abs_inputs[channel]]
+            self.positions[channel] = 0
+
+        # Let the label and position columns take up spare width
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 1)
+        main_layout.addLayout(grid)
+
+        # Widget references per channel, for the per-poll update loop
+        self._channel_widgets = [
+            (ch, self.pos_labels[ch], tuple(self.buttons[ch])) for ch in CHANNELS
+        ]
+
+        # Status bar
+        self.status = QLabel("Ready.")
+        self._last_status = "Ready."
+        main_layout.addWidget(self.status)
+        
+        self.setLayout(main_layout)
+
+    def _set_status(self, text: str):
+        """Show a status message, skipping the repaint if it is unchanged."""
+        if text != self._last_status:
+            self.status.setText(text)
+            self._last_status = text
+
+    def update_positions(self):
+        """Read current positions from controller right away."""
+        if self.poller is None:
+            return
+        
+        positions, errors = self.poller.poll()
+        self._apply_positions(positions)
+        self._apply_errors(errors)
+
+    def _update_one(self, channel: int):
+        """Read one channel's position from the controller right away."""
+        if self.poller is None:
+            return
+        
+        positions, errors = self.poller.poll_channel(channel)
+        self._show_positions(positions)
+        self._apply_errors(errors)
+
+    @pyqtSlot(dict)
+    def _apply_positions(self, positions: Dict[int, Optional[int]]):
+        """Show polled positions; no USB I/O happens here."""
+        if positions == self._last_positions:
+            self._idle_ticks += 1
+            if self._idle_ticks == self.IDLE_TICKS and self.poller is not None:
+                self.poller.set_interval(self._idle_interval)
+        else:
+            self._last_positions = positions
+            self._poll_active()
+        self._show_positions(positions)
+
+    def _show_positions(self, positions: Dict[int, Optional[int]]):
+        """Display the given channels' positions, or "No motor" for None."""
+        updates = []
+        for channel, pos_label, buttons in self._channel_widgets:
+            if channel not in positions:
+                continue
+            pos = positions[channel]
+            if pos is not None:
+                self.positions[channel] = pos
+                updates.append((channel, pos_label, buttons, str(pos), True))
+            else:
+                updates.append((channel, pos_label, buttons, "No motor", False))
+        self._show_channels(updates)
+
+    def _show_channels(self, updates):
+        """Update channel labels and controls, skipping unchanged widgets.
+        
+        Args:
+            updates: (channel, pos_label, buttons, text, enabled) per channel
+        """
+        label_text = self._label_text
+        enabled_state = self._enabled_state
+        changed = [
+            u for u in updates
+            if label_text.get(u[0]) != u[3] or enabled_state.get(u[0]) != u[4]
+        ]
+        if not changed:
+            return
+        
+        # Suspend repaints so all changes land in one paint event
+        self.setUpdatesEnabled(False)
+        try:
+            for channel, pos_label, buttons, text, enabled in changed:
+                if label_text.get(channel) != text:
+                    pos_label.setText(text)
+                    label_text[channel] = text
+                if enabled_state.get(channel) != enabled:
+                    for w in buttons:
+                        w.setEnabled(enabled)
+                    enabled_state[channel] = enabled
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _poll_active(self):
+        """Return to the fast polling interval, e.g. after a move command."""
+        self._idle_ticks = 0
+        if self.poller is not None:
+            self.poller.set_interval(self._active_interval)
+
+    def _refresh_after_move(self, channels):
+        """Show the result of a move: read the moved channels back right away
+        in "accuracy" readback mode, otherwise just pull the next background
+        poll forward."""
+        self._poll_active()
+        if self._sync_readback:
+            if len(channels) == 1:
+                self._update_one(channels[0])
+            else:
+                self.update_positions()
+        elif self.poller is not None:
+            self.poller.poll_now()
+
+    @pyqtSlot(dict)
+    def _apply_errors(self, errors: Dict[int, str]):
+        """Mark channels that could not be read."""
+        self._show_channels([
+            (channel, pos_label, buttons, "Error", False)
+            for channel, pos_label, buttons in self._channel_widgets
+            if channel in errors
+        ])
+
+    # Input handlers are connected as typed clicked()/editingFinished()
+    # slots, so PyQt neither passes the checked flag nor has to retry the
+    # call without it; the channel (and jog direction) come from the sending
+    # widget's properties
+
+    @pyqtSlot()
+    def _on_jog_pressed(self):
+        """Jog the sending button's channel one step in its direction.
+        
+        Auto-repeat emits pressed again for every repeat, adding a step each.
+        """
+        btn = self.sender()
+        self.move_relative(btn.property("channel"), btn.property("direction"))
+
+    @pyqtSlot()
+    def _on_go_clicked(self):
+        """Move the sending button's channel to its target."""
+        self.move_absolute(self.sender().property("channel"))
+
+    @pyqtSlot()
+    def _on_home_clicked(self):
+        """Zero the sending button's channel."""
+        self.set_home(self.sender().property("channel"))
+
+    @pyqtSlot()
+    def _on_step_edited(self):
+        """Cache the step size of the edited input's channel."""
+        self._cache_step(self.sender().property("channel"))
+
+    def move_relative(self, channel: int, direction: int):
+        """Move motor relative to current position.
+        
+        Steps requested while a move is still running are accumulated and
+        sent as one move once it finishes, so holding a jog button keeps a
+        single move in flight.
+        """
+        if self.controller is None:
+            self._set_status(_STATUS_NOT_CONNECTED)
+            return
+        step_input = self.step_inputs[channel]
+        if not step_input.hasAcceptableInput():
+            # "" or "-" never fires editingFinished; show the step actually used
+            step_input.setText(str(self._step_cache[channel]))
+        self._pending_rel[channel] += self._step_cache[channel] * direction
+        self._flush_timer.start(self.JOG_COALESCE_MS)
+
+    def _cache_step(self, channel: int):
+        """Parse a channel's step size once its input has been committed."""
+        self._step_cache[channel] = int(self.step_inputs[channel].text() or 0)
+
+    @pyqtSlot()
+    def _flush_relative(self):
+        """Send the accumulated jog steps, one merged move per channel."""
+        if self._moves_in_flight:
+            # sent once the running move has finished
+            return
+        self._send_pending_jog()
+
+    def _send_pending_jog(self):
+        """Start the accumulated jog steps as one move, if there are any."""
+        steps = {ch: s for ch, s in self._pending_rel.items() if s}
+        self._pending_rel.clear()
+        if not steps:
+            return
+        moved = ", ".join(f"Ch{ch} by {s}" for ch, s in steps.items())
+        self._start_move(
+            functools.partial(self.controller.move_all_relative, steps),
+            tuple(steps), f"Moved {moved} steps", "Move error"
+        )
+
+    def move_absolute(self, channel: int):
+        """Move motor to absolute position."""
+        if self.controller is None:
+            self._set_status(_STATUS_NOT_CONNECTED)
+            return
+        abs_input = self.abs_inputs[channel]
+        if not abs_input.hasAcceptableInput():
+            self._set_status(f"Invalid target for Ch{channel}")
+            return
+        target = int(abs_input.text())
+        # keep the order of moves: jogs requested earlier go first
+        self._send_pending_jog()
+        self._start_move(
+            functools.partial(self.controller.move_to_target, channel, target),
+            (channel,), f"Moved Ch{channel} to {target}", "Move error"
+        )
+
+    def set_home(self, channel: int):
+        """Set current position as home (zero)."""
+        if self.controller is None:
+            self._set_status(_STATUS_NOT_CONNECTED)
+            return
+        self._send_pending_jog()
+        self._start_move(
+            functools.partial(self.controller.set_home_position, channel),
+            (channel,), f"Set Ch{channel} home", "Set home error"
+        )
+
+    def _start_move(self, move, channels: Tuple[int, ...], done: str, failed: str):
+        """Run a blocking controller call on the motion thread.
+        
+        Args:
+            move: Callable issuing the move and waiting for it to finish
+            channels: Channels the move affects, read back afterwards
+            done: Status text shown once the move has finished
+            failed: Status prefix shown with the error if the move fails
+        """
+        def run():
+            if self._closed:
+                # queued before the window closed
+                return
+            try:
+                move()
+            except DEVICE_ERRORS as e:
+                self._move_failed.emit(f"{failed}: {e}")
+            except Exception as e:
+                # last resort: the executor would silently keep the exception
+                self._move_failed.emit(f"{failed}: {e!r}")
+            else:
+                self._move_finished.emit(done, channels)
+        
+        self._moves_in_flight += 1
+        self._motion.submit(run)
+        # poll fast while the motors move, not only once the move is done
+        self._poll_active()
+
+    @pyqtSlot(str, tuple)
+    def _on_move_finished(self, status: str, channels: Tuple[int, ...]):
+        """Report a completed move and send any jog queued behind it."""
+        self._moves_in_flight -= 1
+        self._set_status(status)
+        self._refresh_after_move(channels)
+        if self._pending_rel:
+            self._flush_timer.start(self.JOG_COALESCE_MS)
+
+    @pyqtSlot(str)
+    def _on_move_failed(self, status: str):
+        """Report a failed move and send any jog queued behind it."""
+        self._moves_in_flight -= 1
+        self._set_status(status)
+        if self._pending_rel:
+            self._flush_timer.start(self.JOG_COALESCE_MS)
+
+    def showEvent(self, event):
+        """Resume polling while the window is visible."""
+        if self.poller is not None:
+            self.poller.resume()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Pause polling while nobody can see the positions."""
+        if self.poller is not None:
+            self.poller.pause()
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        """Pause polling while minimized; resuming polls right away."""
+        if event.type() == QEvent.WindowStateChange and self.poller is not None:
+            if self.isMinimized():
+                self.poller.pause()
+            elif self.isVisible():
+                self.poller.resume()
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        """Clean up on window close."""
+        self._flush_timer.stop()
+        self._pending_rel.clear()
+        self._closed = True
+        self._motion.shutdown(wait=False)
+        if self.poller is not None:
+            self.poller.stop()
+            self.poller.wait()
+        event.accept()